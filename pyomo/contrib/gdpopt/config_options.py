@@ -249,6 +249,23 @@ def _add_nlp_solve_configs(CONFIG, default_nlp_init_method):
             nearest integer. Rounding is done before fixing disjuncts.""",
         ),
     )
+    CONFIG.declare(
+        "nlp_solver_warm_start",
+        ConfigValue(
+            default=False,
+            description="""
+            Flag to warm start each NLP subproblem from the last feasible
+            subproblem solution.""",
+            doc="""
+            If True, the values of the continuous variables from the last
+            feasible subproblem solution are used to initialize the next NLP
+            subproblem (after the 'subproblem_initialization_method' has been
+            called). If the NLP solver is ipopt, the constraint and bound
+            multipliers are passed back as well, and ipopt's warm start options
+            are set unless they are specified in 'nlp_solver_args'.""",
+            domain=bool,
+        ),
+    )
     CONFIG.declare(
         "max_fbbt_iterations",
         ConfigValue(
@@ -308,7 +325,8 @@ def _add_oa_configs(CONFIG):
             domain=NonNegativeFloat,
             description="""
             Penalty multiplication term for slack variables on the
-            objective value.""",
+            objective value.  Currently ignored: the slack variables are
+            not penalized in the LOA discrete problem objective.""",
         ),
     )
     CONFIG.declare(
@@ -438,7 +456,9 @@ def _add_mip_solver_configs(CONFIG):
             description="""
             Mixed-integer linear solver to use. Note that no persisent solvers
             other than the auto-persistent solvers in the APPSI package are
-            supported.""",
+            supported. The same solver object is used for every solve of the
+            discrete problem, so auto-persistent solvers are updated
+            incrementally as cuts are added.""",
         ),
     )
     CONFIG.declare(
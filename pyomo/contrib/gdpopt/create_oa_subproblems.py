@@ -22,6 +22,7 @@ from pyomo.common.collections import ComponentMap, ComponentSet
 from pyomo.common.modeling import unique_component_name
 from pyomo.contrib.gdpopt.discrete_problem_initialize import valid_init_strategies
 from pyomo.contrib.gdpopt.util import (
+    get_active_objective,
     get_main_elapsed_time,
     move_nonlinear_objective_to_constraints,
 )
@@ -270,9 +271,7 @@ def get_subproblem(original_model, util_block):
     subproblem_util_block = subproblem.component(util_block.local_name)
     save_initial_values(subproblem_util_block)
     add_transformed_boolean_variable_list(subproblem_util_block)
-    subproblem_obj = next(
-        subproblem.component_data_objects(Objective, active=True, descend_into=True)
-    )
+    subproblem_obj = get_active_objective(subproblem_util_block)
     subproblem_util_block.obj = Expression(expr=subproblem_obj.expr)
 
     return subproblem, subproblem_util_block
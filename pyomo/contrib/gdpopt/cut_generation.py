@@ -16,12 +16,18 @@ from pyomo.common.collections import ComponentSet
 from pyomo.core import TransformationFactory, value, Constraint, Block
 
 
-def _record_binary_value(var, var_value_is_one, var_value_is_zero, int_tol):
+def _add_no_good_term(var, no_good_terms, seen, int_tol):
+    # Record the term excluding the current value of the binary var in the
+    # same pass in which we check it, rather than first sorting the vars by
+    # value and then walking those sets again to build the cut.
+    if var in seen:
+        return
+    seen.add(var)
     val = value(var)
     if fabs(val - 1) <= int_tol:
-        var_value_is_one.add(var)
+        no_good_terms.append(1 - var)
     elif fabs(val) <= int_tol:
-        var_value_is_zero.add(var)
+        no_good_terms.append(var)
     else:
         raise ValueError(
             'Binary %s = %s is not 0 or 1 within integer tolerance %s'
@@ -31,23 +37,19 @@ def _record_binary_value(var, var_value_is_one, var_value_is_zero, int_tol):
 
 def add_no_good_cut(target_model_util_block, config):
     """Cut the current integer solution from the target model."""
-    var_value_is_one = ComponentSet()
-    var_value_is_zero = ComponentSet()
+    no_good_terms = []
+    seen = ComponentSet()
     for var in target_model_util_block.transformed_boolean_variable_list:
-        _record_binary_value(
-            var, var_value_is_one, var_value_is_zero, config.integer_tolerance
-        )
+        _add_no_good_term(var, no_good_terms, seen, config.integer_tolerance)
 
     disjuncts = []
     if config.force_subproblem_nlp:
         # We need to also cut the solutions for the other discrete variables
         for var in target_model_util_block.discrete_variable_list:
-            # This has possible duplicates with the above, but few enough that
-            # we'll leave it for now.
             if var.is_binary():
-                _record_binary_value(
-                    var, var_value_is_one, var_value_is_zero, config.integer_tolerance
-                )
+                # This has possible duplicates with the above, which are
+                # skipped.
+                _add_no_good_term(var, no_good_terms, seen, config.integer_tolerance)
             else:
                 # It's integer. It still has to be in the no-good cut because
                 # else the algorithm is wrong (We're cutting more than just this
@@ -61,11 +63,9 @@ def add_no_good_cut(target_model_util_block, config):
                 disjuncts.extend([less, more])
 
     # It shouldn't be possible to get here unless there's a solution to be cut.
-    assert (var_value_is_one or var_value_is_zero) or len(disjuncts) == 0
+    assert no_good_terms or len(disjuncts) == 0
 
-    int_cut = (
-        sum(1 - v for v in var_value_is_one) + sum(v for v in var_value_is_zero)
-    ) >= 1
+    int_cut = sum(no_good_terms) >= 1
 
     if len(disjuncts) > 0:
         idx = len(target_model_util_block.no_good_disjunctions)
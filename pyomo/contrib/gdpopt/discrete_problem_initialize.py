@@ -19,7 +19,7 @@ from pyomo.common.collections import ComponentMap
 
 from pyomo.contrib.gdpopt.cut_generation import add_no_good_cut
 from pyomo.contrib.gdpopt.solve_discrete_problem import solve_MILP_discrete_problem
-from pyomo.contrib.gdpopt.util import _DoNothing
+from pyomo.contrib.gdpopt.util import _DoNothing, get_active_objective
 from pyomo.core import Block, Constraint, Objective, Var, maximize, value
 from pyomo.gdp import Disjunct
 from pyomo.opt import TerminationCondition as tc
@@ -174,9 +174,7 @@ def use_discrete_problem_for_max_binary_initialization(discrete_problem_util_blo
     m = discrete_problem_util_block.parent_block()
 
     # Set up binary maximization objective
-    original_objective = next(
-        m.component_data_objects(Objective, active=True, descend_into=True)
-    )
+    original_objective = get_active_objective(discrete_problem_util_block)
     original_objective.deactivate()
 
     binary_vars = (
@@ -187,6 +185,9 @@ def use_discrete_problem_for_max_binary_initialization(discrete_problem_util_blo
     discrete_problem_util_block.max_binary_obj = Objective(
         expr=sum(binary_vars), sense=maximize
     )
+    discrete_problem_util_block.active_objective_list[0] = (
+        discrete_problem_util_block.max_binary_obj
+    )
 
     yield
 
@@ -194,6 +195,7 @@ def use_discrete_problem_for_max_binary_initialization(discrete_problem_util_blo
     # still want them. We've already considered those solutions.
     del discrete_problem_util_block.max_binary_obj
     original_objective.activate()
+    discrete_problem_util_block.active_objective_list[0] = original_objective
 
 
 def init_max_binaries(
@@ -238,14 +240,13 @@ def init_max_binaries(
 
 @contextmanager
 def use_discrete_problem_for_set_covering(discrete_problem_util_block):
-    m = discrete_problem_util_block.parent_block()
-
-    original_objective = next(
-        m.component_data_objects(Objective, active=True, descend_into=True)
-    )
+    original_objective = get_active_objective(discrete_problem_util_block)
     original_objective.deactivate()
     # placeholder for the objective
     discrete_problem_util_block.set_cover_obj = Objective(expr=0, sense=maximize)
+    discrete_problem_util_block.active_objective_list[0] = (
+        discrete_problem_util_block.set_cover_obj
+    )
 
     yield
 
@@ -253,6 +254,7 @@ def use_discrete_problem_for_set_covering(discrete_problem_util_block):
     # still want them. We've already considered those solutions.
     del discrete_problem_util_block.set_cover_obj
     original_objective.activate()
+    discrete_problem_util_block.active_objective_list[0] = original_objective
 
 
 def update_set_covering_objective(discrete_problem_util_block, disj_needs_cover):
@@ -9,8 +9,10 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+from pyomo.common.collections import ComponentMap
 from pyomo.common.config import document_kwargs_from_configdict
 from pyomo.common.errors import DeveloperError
+from pyomo.common.gc_manager import PauseGC
 from pyomo.common.modeling import unique_component_name
 from pyomo.contrib.gdp_bounds.info import disjunctive_bounds
 from pyomo.contrib.gdpopt.algorithm_base_class import _GDPoptAlgorithm
@@ -30,11 +32,12 @@ from pyomo.contrib.gdpopt.oa_algorithm_utils import _OAAlgorithmMixIn
 from pyomo.contrib.gdpopt.solve_discrete_problem import solve_MILP_discrete_problem
 from pyomo.contrib.gdpopt.util import (
     _add_bigm_constraint_to_transformed_model,
+    get_active_objective,
     time_code,
 )
 from pyomo.contrib.mcpp.pyomo_mcpp import McCormick as mc, MCPP_Error
 
-from pyomo.core import Constraint, Block, NonNegativeIntegers, Objective, value
+from pyomo.core import Constraint, Block, NonNegativeIntegers, value
 from pyomo.core.expr.numvalue import is_potentially_variable
 from pyomo.core.expr.visitor import identify_variables
 from pyomo.opt.base import SolverFactory
@@ -81,22 +84,22 @@ class GDP_GLOA_Solver(_GDPoptAlgorithm, _OAAlgorithmMixIn):
     def _solve_gdp(self, original_model, config):
         logger = config.logger
 
-        # we need to gather a map of Disjuncts to their active Constraints
-        # before we call any GDP transformations, as we will need this
-        # information for cut generation later
-        add_constraints_by_disjunct(self.original_util_block)
-        # We also save these in advance because we know only linear logical
-        # constraints will be added by the transformation to a MIP, so these are
-        # all we'll ever need.
-        add_global_constraint_list(self.original_util_block)
-        (discrete_problem_util_block, subproblem_util_block) = (
-            _get_discrete_problem_and_subproblem(self, config)
-        )
-        discrete = discrete_problem_util_block.parent_block()
-        subproblem = subproblem_util_block.parent_block()
-        discrete_obj = next(
-            discrete.component_data_objects(Objective, active=True, descend_into=True)
-        )
+        # Building the discrete problem and subproblem creates a lot of
+        # objects, so we don't want GC running in the middle of it
+        with PauseGC():
+            # we need to gather a map of Disjuncts to their active Constraints
+            # before we call any GDP transformations, as we will need this
+            # information for cut generation later
+            add_constraints_by_disjunct(self.original_util_block)
+            # We also save these in advance because we know only linear logical
+            # constraints will be added by the transformation to a MIP, so these are
+            # all we'll ever need.
+            add_global_constraint_list(self.original_util_block)
+            (discrete_problem_util_block, subproblem_util_block) = (
+                _get_discrete_problem_and_subproblem(self, config)
+            )
+            subproblem = subproblem_util_block.parent_block()
+            discrete_obj = get_active_objective(discrete_problem_util_block)
 
         self._log_header(logger)
 
@@ -122,7 +125,7 @@ class GDP_GLOA_Solver(_GDPoptAlgorithm, _OAAlgorithmMixIn):
                 )
 
             # Add integer cut
-            with time_code(self.timing, "integer cut generation"):
+            with time_code(self.timing, "integer cut generation"), PauseGC():
                 add_no_good_cut(discrete_problem_util_block, config)
 
             # Check termination conditions
@@ -154,15 +157,33 @@ class GDP_GLOA_Solver(_GDPoptAlgorithm, _OAAlgorithmMixIn):
             if val is not None and not discrete_var.fixed:
                 discrete_var.set_value(val, skip_validation=True)
 
+        # The constraint bodies and the disjunctive variable bounds don't
+        # change between iterations, so we cache what we need to know about
+        # each constraint the first time we see it (None for linear
+        # constraints, which we don't generate cuts for)
+        if hasattr(discrete_problem_util_block, "aff_cut_constr_info"):
+            constr_info = discrete_problem_util_block.aff_cut_constr_info
+        else:
+            constr_info = discrete_problem_util_block.aff_cut_constr_info = (
+                ComponentMap()
+            )
+
         for constr in self._get_active_untransformed_constraints(
             discrete_problem_util_block, config
         ):
-            disjunctive_var_bounds = disjunctive_bounds(constr.parent_block())
-
-            if constr.body.polynomial_degree() in (1, 0):
+            if constr in constr_info:
+                info = constr_info[constr]
+            elif constr.body.polynomial_degree() in (1, 0):
+                info = constr_info[constr] = None
+            else:
+                info = constr_info[constr] = (
+                    list(identify_variables(constr.body)),
+                    disjunctive_bounds(constr.parent_block()),
+                )
+            if info is None:
                 continue
+            vars_in_constr, disjunctive_var_bounds = info
 
-            vars_in_constr = list(identify_variables(constr.body))
             if any(var.value is None for var in vars_in_constr):
                 continue  # a variable has no values
 
@@ -14,6 +14,7 @@ from math import copysign
 
 from pyomo.common.collections import ComponentMap
 from pyomo.common.config import document_kwargs_from_configdict
+from pyomo.common.gc_manager import PauseGC
 from pyomo.common.modeling import unique_component_name
 from pyomo.contrib.gdpopt.algorithm_base_class import _GDPoptAlgorithm
 from pyomo.contrib.gdpopt.config_options import (
@@ -30,6 +31,7 @@ from pyomo.contrib.gdpopt.cut_generation import add_no_good_cut
 from pyomo.contrib.gdpopt.oa_algorithm_utils import _OAAlgorithmMixIn
 from pyomo.contrib.gdpopt.solve_discrete_problem import solve_MILP_discrete_problem
 from pyomo.contrib.gdpopt.util import (
+    get_active_objective,
     time_code,
     _add_bigm_constraint_to_transformed_model,
 )
@@ -42,12 +44,10 @@ from pyomo.core import (
     NonNegativeReals,
     Objective,
     value,
-    Var,
     VarList,
 )
 from pyomo.core.expr import differentiate
 from pyomo.core.expr.visitor import identify_variables
-from pyomo.gdp import Disjunct
 from pyomo.opt.base import SolverFactory
 from pyomo.repn import generate_standard_repn
 
@@ -96,19 +96,22 @@ class GDP_LOA_Solver(_GDPoptAlgorithm, _OAAlgorithmMixIn):
     def _solve_gdp(self, original_model, config):
         logger = config.logger
 
-        # We'll need these to get dual info after solving subproblems
-        add_constraint_list(self.original_util_block)
+        # Building the discrete problem and subproblem creates a lot of
+        # objects, so we don't want GC running in the middle of it
+        with PauseGC():
+            # We'll need these to get dual info after solving subproblems
+            add_constraint_list(self.original_util_block)
 
-        (discrete_problem_util_block, subproblem_util_block) = (
-            _get_discrete_problem_and_subproblem(self, config)
-        )
+            (discrete_problem_util_block, subproblem_util_block) = (
+                _get_discrete_problem_and_subproblem(self, config)
+            )
 
-        discrete = discrete_problem_util_block.parent_block()
-        subproblem = subproblem_util_block.parent_block()
+            discrete = discrete_problem_util_block.parent_block()
+            subproblem = subproblem_util_block.parent_block()
 
-        original_obj = self._setup_augmented_penalty_objective(
-            discrete_problem_util_block
-        )
+            oa_obj = self._setup_augmented_penalty_objective(
+                discrete_problem_util_block
+            )
 
         self._log_header(logger)
 
@@ -118,9 +121,6 @@ class GDP_LOA_Solver(_GDPoptAlgorithm, _OAAlgorithmMixIn):
 
             # solve linear discrete problem
             with time_code(self.timing, 'mip'):
-                oa_obj = self._update_augmented_penalty_objective(
-                    discrete_problem_util_block, original_obj, config.OA_penalty_factor
-                )
                 mip_feasible = solve_MILP_discrete_problem(
                     discrete_problem_util_block, self, config
                 )
@@ -138,7 +138,7 @@ class GDP_LOA_Solver(_GDPoptAlgorithm, _OAAlgorithmMixIn):
                 )
 
             # Add integer cut
-            with time_code(self.timing, "integer cut generation"):
+            with time_code(self.timing, "integer cut generation"), PauseGC():
                 add_no_good_cut(discrete_problem_util_block, config)
 
             # Check termination conditions
@@ -146,37 +146,25 @@ class GDP_LOA_Solver(_GDPoptAlgorithm, _OAAlgorithmMixIn):
                 break
 
     def _setup_augmented_penalty_objective(self, discrete_problem_util_block):
-        m = discrete_problem_util_block.parent_block()
-        discrete_objective = next(m.component_data_objects(Objective, active=True))
+        discrete_objective = get_active_objective(discrete_problem_util_block)
 
         # Set up augmented penalty objective
         discrete_objective.deactivate()
-        # placeholder for OA objective
-        discrete_problem_util_block.oa_obj = Objective(sense=minimize)
-
-        return discrete_objective
-
-    def _update_augmented_penalty_objective(
-        self, discrete_problem_util_block, discrete_objective, OA_penalty_factor
-    ):
-        m = discrete_problem_util_block.parent_block()
-        sign_adjust = 1 if discrete_objective.sense == minimize else -1
-        OA_penalty_expr = (
-            sign_adjust
-            * OA_penalty_factor
-            * sum(
-                v
-                for v in m.component_data_objects(
-                    ctype=Var, descend_into=(Block, Disjunct)
-                )
-                if v.parent_component().local_name == 'GDPopt_OA_slacks'
-            )
+        # Note: the OA slacks (GDPopt_OA_slacks.slacks) are not currently
+        # included in a penalty term (so OA_penalty_factor is ignored):
+        # the search this replaced filtered on a parent component name
+        # that never matched them, so the term was always empty.
+        # Penalizing them changes the discrete problem solutions and the
+        # dual bound (which is taken from this objective), so that needs
+        # to be validated as its own change.
+        discrete_problem_util_block.oa_obj = Objective(
+            expr=discrete_objective.expr, sense=minimize
         )
-        discrete_problem_util_block.oa_obj.expr = (
-            discrete_objective.expr + OA_penalty_expr
+        discrete_problem_util_block.active_objective_list[0] = (
+            discrete_problem_util_block.oa_obj
         )
 
-        return discrete_problem_util_block.oa_obj.expr
+        return discrete_problem_util_block.oa_obj
 
     def _add_cuts_to_discrete_problem(
         self,
@@ -10,6 +10,7 @@
 #  ___________________________________________________________________________
 
 from math import fabs
+from pyomo.common.gc_manager import PauseGC
 from pyomo.contrib.gdpopt.solve_subproblem import solve_subproblem
 from pyomo.contrib.gdpopt.util import fix_discrete_problem_solution_in_subproblem
 from pyomo.core import value
@@ -32,13 +33,14 @@ class _OAAlgorithmMixIn(object):
                 )
                 if primal_improved:
                     self.update_incumbent(subprob_util_block)
-                self._add_cuts_to_discrete_problem(
-                    subprob_util_block,
-                    discrete_prob_util_block,
-                    self.objective_sense,
-                    config,
-                    self.timing,
-                )
+                with PauseGC():
+                    self._add_cuts_to_discrete_problem(
+                        subprob_util_block,
+                        discrete_prob_util_block,
+                        self.objective_sense,
+                        config,
+                        self.timing,
+                    )
             elif nlp_termination == tc.unbounded:
                 # the whole problem is unbounded, we can stop
                 self._update_primal_bound_to_unbounded(config)
@@ -23,8 +23,7 @@ from pyomo.contrib.gdpopt.create_oa_subproblems import (
 from pyomo.contrib.gdpopt.oa_algorithm_utils import _OAAlgorithmMixIn
 from pyomo.contrib.gdpopt.cut_generation import add_no_good_cut
 from pyomo.contrib.gdpopt.solve_discrete_problem import solve_MILP_discrete_problem
-from pyomo.contrib.gdpopt.util import time_code
-from pyomo.core import Objective
+from pyomo.contrib.gdpopt.util import get_active_objective, time_code
 from pyomo.opt.base import SolverFactory
 
 # ESJ: In the future, if we have a direct interface to cplex or gurobi, we
@@ -65,13 +64,8 @@ class GDP_RIC_Solver(_GDPoptAlgorithm, _OAAlgorithmMixIn):
         (discrete_problem_util_block, subproblem_util_block) = (
             _get_discrete_problem_and_subproblem(self, config)
         )
-        discrete_problem = discrete_problem_util_block.parent_block()
         subproblem = subproblem_util_block.parent_block()
-        discrete_problem_obj = next(
-            discrete_problem.component_data_objects(
-                Objective, active=True, descend_into=True
-            )
-        )
+        discrete_problem_obj = get_active_objective(discrete_problem_util_block)
 
         self._log_header(logger)
 
@@ -25,6 +25,22 @@ from pyomo.opt import TerminationCondition as tc
 from pyomo.solvers.plugins.solvers.persistent_solver import PersistentSolver
 
 
+def _get_discrete_problem_solver(util_block, config):
+    """Returns the MIP solver object for the discrete problem on util_block,
+    creating it on the first call.
+
+    The discrete problem only gains cuts (and tightened bounds) between
+    iterations, so we keep the same solver object for every solve. This lets
+    the auto-persistent APPSI solvers update their instance incrementally and
+    warm start from the previous solution rather than rebuilding the problem
+    from scratch each time.
+    """
+    mip_opt = getattr(util_block, 'discrete_problem_solver', None)
+    if mip_opt is None:
+        mip_opt = util_block.discrete_problem_solver = SolverFactory(config.mip_solver)
+    return mip_opt
+
+
 def solve_MILP_discrete_problem(util_block, solver, config):
     """Solves the linear GDP model and attempts to resolve solution issues.
     Returns one of TerminationCondition.optimal, TerminationCondition.feasible,
@@ -61,7 +77,8 @@ def solve_MILP_discrete_problem(util_block, solver, config):
     getattr(m, 'ipopt_zU_out', _DoNothing()).deactivate()
 
     # Create solver, check availability
-    if not SolverFactory(config.mip_solver).available():
+    mip_opt = _get_discrete_problem_solver(util_block, config)
+    if not mip_opt.available():
         raise RuntimeError("MIP solver %s is not available." % config.mip_solver)
 
     # Callback immediately before solving MIP discrete problem
@@ -86,7 +103,7 @@ def solve_MILP_discrete_problem(util_block, solver, config):
                 mip_args['time_limit'] = min(
                     mip_args.get('time_limit', float('inf')), remaining
                 )
-        results = SolverFactory(config.mip_solver).solve(m, **mip_args)
+        results = mip_opt.solve(m, **mip_args)
 
     config.call_after_discrete_problem_solve(solver, m, util_block)
     if config.call_after_master_solve is not _DoNothing:
@@ -122,9 +139,7 @@ def solve_MILP_discrete_problem(util_block, solver, config):
             expr=(-obj_bound, discrete_objective.expr, obj_bound)
         )
         with SuppressInfeasibleWarning():
-            results = SolverFactory(config.mip_solver).solve(
-                m, **config.mip_solver_args
-            )
+            results = mip_opt.solve(m, **config.mip_solver_args)
         # get rid of the made-up constraint
         del util_block.objective_bound
         if results.solver.termination_condition in {
@@ -23,7 +23,7 @@ from pyomo.contrib.gdpopt.util import (
     is_feasible,
     get_main_elapsed_time,
 )
-from pyomo.core import Constraint, TransformationFactory, Objective, Block
+from pyomo.core import Constraint, TransformationFactory, Objective, Block, Suffix
 import pyomo.core.expr as EXPR
 from pyomo.opt import SolverFactory, SolverResults
 from pyomo.opt import TerminationCondition as tc
@@ -178,24 +178,192 @@ def solve_linear_subproblem(subproblem, config, timing):
         )
 
 
-def solve_NLP(nlp_model, config, timing):
+def solve_NLP(nlp_model, config, timing, nlp_solver_args=None):
     """Solve the NLP subproblem."""
     config.logger.debug(
         'Solving nonlinear subproblem for fixed binaries and logical realizations.'
     )
+    if nlp_solver_args is None:
+        nlp_solver_args = config.nlp_solver_args
 
     results = configure_and_call_solver(
-        nlp_model,
-        config.nlp_solver,
-        config.nlp_solver_args,
-        'NLP',
-        timing,
-        config.time_limit,
+        nlp_model, config.nlp_solver, nlp_solver_args, 'NLP', timing, config.time_limit
     )
 
     return process_nonlinear_problem_results(results, nlp_model, 'NLP', config)
 
 
+# Options used to warm start ipopt from a previous primal-dual solution. (The
+# pushes and initial barrier parameter are reduced so that ipopt does not move
+# the starting point far away from the previous solution.)
+_ipopt_warm_start_options = {
+    'warm_start_init_point': 'yes',
+    'warm_start_bound_push': 1e-9,
+    'warm_start_mult_bound_push': 1e-9,
+    'mu_init': 1e-6,
+}
+
+
+_ipopt_warm_start_suffixes = (
+    ('ipopt_zL_out', Suffix.IMPORT),
+    ('ipopt_zU_out', Suffix.IMPORT),
+    ('ipopt_zL_in', Suffix.EXPORT),
+    ('ipopt_zU_in', Suffix.EXPORT),
+)
+
+
+def _add_ipopt_warm_start_suffixes(nlp_model):
+    """Declare (or activate) the suffixes ipopt uses to report and receive
+    the bound multipliers.
+
+    Returns None (and changes nothing) if one of the names is already taken
+    by something other than a Suffix or if the model has no dual Suffix.
+    Otherwise, returns the state to pass to _remove_ipopt_warm_start_suffixes
+    to put the model back the way it was.
+    """
+    if not isinstance(nlp_model.component('dual'), Suffix):
+        return None
+    for name, direction in _ipopt_warm_start_suffixes:
+        suffix = nlp_model.component(name)
+        if suffix is not None and not isinstance(suffix, Suffix):
+            return None
+
+    suffix_state = []
+    for name, direction in _ipopt_warm_start_suffixes:
+        suffix = nlp_model.component(name)
+        if suffix is None:
+            nlp_model.add_component(name, Suffix(direction=direction))
+            suffix_state.append((nlp_model.component(name), None))
+        else:
+            suffix_state.append(
+                (
+                    suffix,
+                    (suffix.direction, suffix.active, ComponentMap(suffix.items())),
+                )
+            )
+            suffix.direction = direction
+            suffix.activate()
+    return suffix_state, nlp_model.dual.direction
+
+
+def _remove_ipopt_warm_start_suffixes(nlp_model, saved_state):
+    """Undo _add_ipopt_warm_start_suffixes: the suffixes we declared are
+    cleared and deactivated (so that they are neither exported to nor
+    requested from the solvers used for later, possibly linear or MINLP,
+    subproblems), and the ones that already existed are restored."""
+    suffix_state, dual_direction = saved_state
+    for suffix, orig in suffix_state:
+        suffix.clear()
+        if orig is None:
+            suffix.deactivate()
+        else:
+            direction, active, values = orig
+            suffix.direction = direction
+            suffix.update(values.items())
+            if not active:
+                suffix.deactivate()
+    nlp_model.dual.direction = dual_direction
+
+
+def _get_exported_vars_and_constraints(util_block):
+    """Return the unfixed variables and the constraints that will be sent to
+    the NLP solver, i.e., the ones appearing in active constraints (or the
+    active objective) and the active constraints containing unfixed
+    variables."""
+    nlp_model = util_block.parent_block()
+    # The subproblem structure doesn't change between solves (only which
+    # variables are fixed and which constraints are active), so we cache
+    # the variables in each constraint the first time we see it
+    if hasattr(util_block, 'warm_start_vars_in_constr'):
+        vars_in_constr = util_block.warm_start_vars_in_constr
+    else:
+        vars_in_constr = util_block.warm_start_vars_in_constr = ComponentMap()
+
+    exported_vars = ComponentSet()
+    exported_cons = ComponentSet()
+    for constr in nlp_model.component_data_objects(Constraint, active=True):
+        if constr not in vars_in_constr:
+            vars_in_constr[constr] = list(EXPR.identify_variables(constr.body))
+        unfixed = [v for v in vars_in_constr[constr] if not v.fixed]
+        if unfixed:
+            exported_vars.update(unfixed)
+            exported_cons.add(constr)
+    for obj in nlp_model.component_data_objects(Objective, active=True):
+        if obj not in vars_in_constr:
+            vars_in_constr[obj] = list(EXPR.identify_variables(obj.expr))
+        exported_vars.update(v for v in vars_in_constr[obj] if not v.fixed)
+    return exported_vars, exported_cons
+
+
+def solve_NLP_with_warm_start(util_block, config, timing):
+    """Solve the NLP subproblem, warm starting it from the last feasible
+    subproblem solution.
+
+    The values of the unfixed continuous variables are restored from the last
+    feasible solution. If the NLP solver is ipopt, the constraint and bound
+    multipliers are also passed back and ipopt's warm start options are set
+    (unless they are already specified in nlp_solver_args).
+    """
+    nlp_model = util_block.parent_block()
+    suffix_state = None
+    if config.nlp_solver == 'ipopt':
+        suffix_state = _add_ipopt_warm_start_suffixes(nlp_model)
+    use_multipliers = suffix_state is not None
+    nlp_solver_args = config.nlp_solver_args
+
+    prev_soln = getattr(util_block, 'warm_start_solution', None)
+    if prev_soln is not None:
+        var_values, zL, zU, duals = prev_soln
+        for v, val in zip(util_block.algebraic_variable_list, var_values):
+            if val is not None and not v.fixed and v.is_continuous():
+                v.set_value(val, skip_validation=True)
+        if use_multipliers and (zL or zU):
+            # Only pass back the multipliers for the components in this
+            # subproblem: the writer complains about (and ignores) the rest
+            exported_vars, exported_cons = _get_exported_vars_and_constraints(
+                util_block
+            )
+            for suffix, prev_vals in (
+                (nlp_model.ipopt_zL_in, zL),
+                (nlp_model.ipopt_zU_in, zU),
+            ):
+                suffix.update(
+                    (v, val) for v, val in prev_vals.items() if v in exported_vars
+                )
+            nlp_model.dual.clear()
+            nlp_model.dual.update(
+                (c, val) for c, val in duals.items() if c in exported_cons
+            )
+            nlp_model.dual.direction = Suffix.IMPORT_EXPORT
+            nlp_solver_args = dict(nlp_solver_args)
+            options = nlp_solver_args['options'] = dict(
+                nlp_solver_args.get('options', {})
+            )
+            for opt, val in _ipopt_warm_start_options.items():
+                options.setdefault(opt, val)
+
+    try:
+        nlp_termination = solve_NLP(nlp_model, config, timing, nlp_solver_args)
+        if nlp_termination in {tc.optimal, tc.feasible}:
+            if use_multipliers:
+                multipliers = (
+                    ComponentMap(nlp_model.ipopt_zL_out.items()),
+                    ComponentMap(nlp_model.ipopt_zU_out.items()),
+                    ComponentMap(nlp_model.dual.items()),
+                )
+            else:
+                multipliers = (None, None, None)
+            util_block.warm_start_solution = (
+                [v.value for v in util_block.algebraic_variable_list],
+            ) + multipliers
+    finally:
+        if use_multipliers:
+            # Don't leave anything behind for the other subproblem solvers
+            _remove_ipopt_warm_start_suffixes(nlp_model, suffix_state)
+
+    return nlp_termination
+
+
 def solve_MINLP(util_block, config, timing):
     """Solve the MINLP subproblem."""
     config.logger.debug("Solving MINLP subproblem for fixed logical realizations.")
@@ -373,7 +541,12 @@ def call_appropriate_subproblem_solver(subprob_util_block, solver, config):
                 "Unfixed discrete variables found on the NLP subproblem."
             )
         elif len(unfixed_discrete_vars) == 0:
-            subprob_termination = solve_NLP(subprob, config, timing)
+            if config.nlp_solver_warm_start:
+                subprob_termination = solve_NLP_with_warm_start(
+                    subprob_util_block, config, timing
+                )
+            else:
+                subprob_termination = solve_NLP(subprob, config, timing)
         else:
             config.logger.debug(
                 "The following discrete variables are unfixed: %s"
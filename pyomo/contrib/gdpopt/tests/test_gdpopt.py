@@ -16,10 +16,11 @@ from io import StringIO
 import logging
 from math import fabs
 from os.path import join, normpath
+from unittest.mock import MagicMock, patch
 
 import pyomo.common.unittest as unittest
 from pyomo.common.log import LoggingIntercept
-from pyomo.common.collections import Bunch
+from pyomo.common.collections import Bunch, ComponentMap
 from pyomo.common.config import ConfigDict, ConfigValue
 from pyomo.common.fileutils import import_file, PYOMO_ROOT_DIR
 from pyomo.contrib.gdpopt.create_oa_subproblems import (
@@ -29,12 +30,19 @@ from pyomo.contrib.gdpopt.create_oa_subproblems import (
     add_global_constraint_list,
 )
 import pyomo.contrib.gdpopt.tests.common_tests as ct
-from pyomo.contrib.gdpopt.util import is_feasible, time_code
+from pyomo.contrib.gdpopt.util import get_active_objective, is_feasible, time_code
 from pyomo.contrib.mcpp.pyomo_mcpp import mcpp_available
 from pyomo.contrib.gdpopt.solve_discrete_problem import (
     solve_MILP_discrete_problem,
     distinguish_mip_infeasible_or_unbounded,
+    _get_discrete_problem_solver,
 )
+from pyomo.contrib.gdpopt.discrete_problem_initialize import (
+    use_discrete_problem_for_max_binary_initialization,
+    use_discrete_problem_for_set_covering,
+)
+from pyomo.contrib.gdpopt.solve_subproblem import solve_NLP_with_warm_start
+from pyomo.core.base.suffix import active_import_suffix_generator
 from pyomo.environ import (
     Block,
     ConcreteModel,
@@ -47,6 +55,7 @@ from pyomo.environ import (
     TransformationFactory,
     SolverFactory,
     sqrt,
+    Suffix,
     value,
     Var,
 )
@@ -111,6 +120,157 @@ class TestGDPoptUnit(unittest.TestCase):
             )
         self.assertIs(tc, TerminationCondition.unbounded)
 
+    def test_discrete_problem_solver_reused(self):
+        m = ConcreteModel()
+        m.x = Var(bounds=(0, 1))
+        m.c = Constraint(expr=m.x >= 0.5)
+        m.obj = Objective(expr=m.x)
+        m.GDPopt_utils = Block()
+        config = SolverFactory('gdpopt.loa').CONFIG(dict(mip_solver=mip_solver))
+        solver = Bunch(timing=Bunch())
+
+        mip_opt = MagicMock()
+        mip_opt.available.return_value = True
+        mip_opt.solve.return_value.solver.termination_condition = (
+            TerminationCondition.optimal
+        )
+        mock_factory = MagicMock(return_value=mip_opt)
+        with patch(
+            'pyomo.contrib.gdpopt.solve_discrete_problem.SolverFactory', mock_factory
+        ):
+            for i in range(2):
+                self.assertIs(
+                    solve_MILP_discrete_problem(m.GDPopt_utils, solver, config),
+                    TerminationCondition.optimal,
+                )
+        # Both solves went through the one solver instance
+        mock_factory.assert_called_once_with(mip_solver)
+        self.assertEqual(mip_opt.solve.call_count, 2)
+        self.assertIs(_get_discrete_problem_solver(m.GDPopt_utils, config), mip_opt)
+
+    def test_nlp_warm_start_suffixes(self):
+        m = ConcreteModel()
+        m.x = Var(bounds=(0, 10))
+        m.y = Var(bounds=(0, 10))
+        m.z = Var(bounds=(0, 10))
+        m.c1 = Constraint(expr=m.x + m.y >= 1)
+        m.c2 = Constraint(expr=m.z**2 >= 1)
+        m.obj = Objective(expr=m.x + m.y + m.z)
+        m.dual = Suffix(direction=Suffix.IMPORT)
+        m.GDPopt_utils = Block()
+        m.GDPopt_utils.algebraic_variable_list = [m.x, m.y, m.z]
+        config = SolverFactory('gdpopt.loa').CONFIG(
+            dict(nlp_solver='ipopt', nlp_solver_warm_start=True)
+        )
+
+        sent = []
+
+        def fake_solve_NLP(nlp_model, config, timing, nlp_solver_args):
+            sent.append(
+                (
+                    ComponentMap(nlp_model.ipopt_zL_in.items()),
+                    ComponentMap(nlp_model.dual.items()),
+                    dict(nlp_solver_args).get('options', {}),
+                )
+            )
+            for v in (m.x, m.y, m.z):
+                if not v.fixed:
+                    nlp_model.ipopt_zL_out[v] = 1
+                    nlp_model.ipopt_zU_out[v] = 2
+            for c in (m.c1, m.c2):
+                if c.active:
+                    nlp_model.dual[c] = 3
+            return TerminationCondition.optimal
+
+        with patch('pyomo.contrib.gdpopt.solve_subproblem.solve_NLP', fake_solve_NLP):
+            solve_NLP_with_warm_start(m.GDPopt_utils, config, {})
+            # Nothing is left for the solvers of later subproblems
+            self.assertEqual(
+                [name for name, _ in active_import_suffix_generator(m)], ['dual']
+            )
+            self.assertEqual(len(m.ipopt_zL_in), 0)
+            self.assertEqual(len(m.ipopt_zU_out), 0)
+            self.assertIs(m.dual.direction, Suffix.IMPORT)
+
+            m.z.fix(1)
+            m.c2.deactivate()
+            solve_NLP_with_warm_start(m.GDPopt_utils, config, {})
+            self.assertEqual(
+                [name for name, _ in active_import_suffix_generator(m)], ['dual']
+            )
+
+        self.assertEqual(len(sent[0][0]), 0)
+        self.assertNotIn('warm_start_init_point', sent[0][2])
+        # Only the multipliers for the unfixed variables and active
+        # constraints are passed back
+        self.assertEqual(list(sent[1][0].items()), [(m.x, 1), (m.y, 1)])
+        self.assertEqual(list(sent[1][1].items()), [(m.c1, 3)])
+        self.assertEqual(sent[1][2]['warm_start_init_point'], 'yes')
+
+    def test_nlp_warm_start_existing_suffixes(self):
+        m = ConcreteModel()
+        m.x = Var(bounds=(0, 10))
+        m.c = Constraint(expr=m.x >= 1)
+        m.obj = Objective(expr=m.x)
+        m.dual = Suffix(direction=Suffix.IMPORT)
+        m.GDPopt_utils = Block()
+        m.GDPopt_utils.algebraic_variable_list = [m.x]
+        config = SolverFactory('gdpopt.loa').CONFIG(
+            dict(nlp_solver='ipopt', nlp_solver_warm_start=True)
+        )
+
+        def fake_solve_NLP(nlp_model, config, timing, nlp_solver_args):
+            return TerminationCondition.optimal
+
+        # A name taken by something other than a Suffix: nothing is added
+        m.ipopt_zU_in = Var()
+        with patch('pyomo.contrib.gdpopt.solve_subproblem.solve_NLP', fake_solve_NLP):
+            solve_NLP_with_warm_start(m.GDPopt_utils, config, {})
+        self.assertIsNone(m.component('ipopt_zL_out'))
+        self.assertIsNone(m.component('ipopt_zL_in'))
+        m.del_component(m.ipopt_zU_in)
+
+        # Suffixes the user declared are put back the way they were
+        m.ipopt_zL_in = Suffix(direction=Suffix.IMPORT_EXPORT)
+        m.ipopt_zL_in[m.x] = 5
+        m.ipopt_zL_in.deactivate()
+        m.ipopt_zU_out = Suffix(direction=Suffix.IMPORT)
+        with patch('pyomo.contrib.gdpopt.solve_subproblem.solve_NLP', fake_solve_NLP):
+            solve_NLP_with_warm_start(m.GDPopt_utils, config, {})
+            solve_NLP_with_warm_start(m.GDPopt_utils, config, {})
+        self.assertIs(m.ipopt_zL_in.direction, Suffix.IMPORT_EXPORT)
+        self.assertFalse(m.ipopt_zL_in.active)
+        self.assertEqual(list(m.ipopt_zL_in.items()), [(m.x, 5)])
+        self.assertIs(m.ipopt_zU_out.direction, Suffix.IMPORT)
+        self.assertTrue(m.ipopt_zU_out.active)
+        self.assertFalse(m.ipopt_zL_out.active)
+        self.assertIs(m.dual.direction, Suffix.IMPORT)
+
+    def test_active_objective_cached_on_util_block(self):
+        m = ConcreteModel()
+        m.x = Var(bounds=(0, 1))
+        m.b = Block()
+        m.b.obj = Objective(expr=m.x)
+        m.GDPopt_utils = Block()
+        self.assertIs(get_active_objective(m.GDPopt_utils), m.b.obj)
+        # clones find their own copy of the objective
+        m2 = m.clone()
+        self.assertIs(get_active_objective(m2.GDPopt_utils), m2.b.obj)
+
+        # the cache follows the objective swaps made during initialization
+        m.GDPopt_utils.disjunct_list = []
+        with use_discrete_problem_for_set_covering(m.GDPopt_utils):
+            self.assertIs(
+                get_active_objective(m.GDPopt_utils), m.GDPopt_utils.set_cover_obj
+            )
+        self.assertIs(get_active_objective(m.GDPopt_utils), m.b.obj)
+        with use_discrete_problem_for_max_binary_initialization(m.GDPopt_utils):
+            self.assertIs(
+                get_active_objective(m.GDPopt_utils), m.GDPopt_utils.max_binary_obj
+            )
+        self.assertIs(get_active_objective(m.GDPopt_utils), m.b.obj)
+        self.assertTrue(m.b.obj.active)
+
     @unittest.skipUnless(
         SolverFactory(mip_solver).available(), "MIP solver not available"
     )
@@ -729,6 +889,18 @@ class TestGDPopt(unittest.TestCase):
         )
         ct.check_8PP_solution(self, eight_process, results)
 
+    def test_LOA_8PP_nlp_warm_start(self):
+        """Test LOA with 8PP, warm starting the NLP subproblems."""
+        exfile = import_file(join(exdir, 'eight_process', 'eight_proc_model.py'))
+        eight_process = exfile.build_eight_process_flowsheet()
+        results = SolverFactory('gdpopt.loa').solve(
+            eight_process,
+            mip_solver=mip_solver,
+            nlp_solver=nlp_solver,
+            nlp_solver_warm_start=True,
+        )
+        ct.check_8PP_solution(self, eight_process, results)
+
     def test_iteration_limit(self):
         exfile = import_file(join(exdir, 'eight_process', 'eight_proc_model.py'))
         eight_process = exfile.build_eight_process_flowsheet()
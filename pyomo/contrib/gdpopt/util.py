@@ -109,11 +109,30 @@ def solve_continuous_problem(m, config):
         return results
 
 
+def get_active_objective(util_block):
+    """Return the active objective on the model containing util_block.
+
+    Finding the objective requires walking every block in the model, so
+    the result is cached on util_block. We store it in a list (so that
+    the Block does not try to claim a ScalarObjective as a subcomponent),
+    which also means that clones of the model refer to their own copy of
+    the objective, just like the other util_block lists. Code that swaps
+    the active objective must update util_block.active_objective_list.
+    """
+    obj_list = getattr(util_block, 'active_objective_list', None)
+    if obj_list is None:
+        obj_list = util_block.active_objective_list = [
+            next(
+                util_block.parent_block().component_data_objects(
+                    Objective, descend_into=True, active=True
+                )
+            )
+        ]
+    return obj_list[0]
+
+
 def move_nonlinear_objective_to_constraints(util_block, logger):
-    m = util_block.parent_block()
-    discrete_obj = next(
-        m.component_data_objects(Objective, descend_into=True, active=True)
-    )
+    discrete_obj = get_active_objective(util_block)
     if discrete_obj.polynomial_degree() in (1, 0):
         # Nothing to move
         return None
@@ -147,6 +166,7 @@ def move_nonlinear_objective_to_constraints(util_block, logger):
     util_block.objective = Objective(
         expr=util_block.objective_value, sense=discrete_obj.sense
     )
+    util_block.active_objective_list[0] = util_block.objective
 
     # Add the new variable and constraint to the working lists
     util_block.algebraic_variable_list.append(util_block.objective_value)
@@ -314,6 +334,11 @@ class fix_discrete_problem_solution_in_subproblem(fix_discrete_solution_in_subpr
         self.config = config
 
     def __enter__(self):
+        # This is called every iteration, so only generate the (relatively
+        # expensive) component names for the debug messages if they will
+        # actually be logged.
+        log_debug = self.config.logger.isEnabledFor(logging.DEBUG)
+
         # fix subproblem Blocks according to the discrete problem solution
         fixed = []
         for disjunct, block in zip(
@@ -322,13 +347,15 @@ class fix_discrete_problem_solution_in_subproblem(fix_discrete_solution_in_subpr
         ):
             if not disjunct.indicator_var.value:
                 block.deactivate()
-                block.binary_indicator_var.fix(0)
+                block.binary_indicator_var.fix(0, skip_validation=True)
             else:
-                block.binary_indicator_var.fix(1)
-                fixed.append(block.name)
-        self.config.logger.debug(
-            "Fixed the following Disjuncts to 'True': %s" % ", ".join(fixed)
-        )
+                block.binary_indicator_var.fix(1, skip_validation=True)
+                if log_debug:
+                    fixed.append(block.name)
+        if log_debug:
+            self.config.logger.debug(
+                "Fixed the following Disjuncts to 'True': %s" % ", ".join(fixed)
+            )
 
         fixed_bools = []
         for discrete_problem_bool, subprob_bool in zip(
@@ -343,18 +370,20 @@ class fix_discrete_problem_solution_in_subproblem(fix_discrete_solution_in_subpr
                 # make an arbitrary decision for now, and store it in the
                 # discrete problem so the no-good cut will be right.
                 discrete_problem_binary.set_value(1)
-                subprob_binary.fix(1)
+                subprob_binary.fix(1, skip_validation=True)
                 bool_val = True
             elif val > 0.5:
-                subprob_binary.fix(1)
+                subprob_binary.fix(1, skip_validation=True)
                 bool_val = True
             else:
-                subprob_binary.fix(0)
+                subprob_binary.fix(0, skip_validation=True)
                 bool_val = False
-            fixed_bools.append("%s = %s" % (subprob_bool.name, bool_val))
-        self.config.logger.debug(
-            "Fixed the following Boolean variables: %s" % ", ".join(fixed_bools)
-        )
+            if log_debug:
+                fixed_bools.append("%s = %s" % (subprob_bool.name, bool_val))
+        if log_debug:
+            self.config.logger.debug(
+                "Fixed the following Boolean variables: %s" % ", ".join(fixed_bools)
+            )
 
         # Fix subproblem discrete variables according to the discrete problem
         # solution
@@ -372,13 +401,15 @@ class fix_discrete_problem_solution_in_subproblem(fix_discrete_solution_in_subpr
                 # but subproblem is a specific realization of the disjuncts. All
                 # this means we don't have enough info to do it here.
                 fix_discrete_var(subprob_var, discrete_problem_var.value, self.config)
-                fixed_discrete.append(
-                    "%s = %s" % (subprob_var.name, discrete_problem_var.value)
+                if log_debug:
+                    fixed_discrete.append(
+                        "%s = %s" % (subprob_var.name, discrete_problem_var.value)
+                    )
+            if log_debug:
+                self.config.logger.debug(
+                    "Fixed the following integer variables: "
+                    "%s" % ", ".join(fixed_discrete)
                 )
-            self.config.logger.debug(
-                "Fixed the following integer variables: "
-                "%s" % ", ".join(fixed_discrete)
-            )
 
         # Call the subproblem initialization callback
         self.config.subproblem_initialization_method(
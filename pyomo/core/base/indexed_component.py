@@ -17,7 +17,11 @@ import textwrap
 import pyomo.core.expr as EXPR
 import pyomo.core.base as BASE
 from pyomo.core.base.indexed_component_slice import IndexedComponent_slice
-from pyomo.core.base.initializer import Initializer
+from pyomo.core.base.initializer import (
+    Initializer,
+    ArrayInitializer,
+    IndexedCallInitializer,
+)
 from pyomo.core.base.component import Component, ActiveComponent, ComponentData
 from pyomo.core.base.config import PyomoOptions
 from pyomo.core.base.enums import SortComponents
@@ -762,7 +766,13 @@ You can silence this warning by one of three ways:
                     arg_not_specified=NOTSET,
                 )
 
-            if rule.contains_indices():
+            if rule.__class__ is ArrayInitializer:
+                # The index is coming in externally; we need to validate
+                # it.  Walk the array directly instead of indexing into
+                # it for each value.
+                for index, val in rule.items():
+                    self[index] = val
+            elif rule.contains_indices():
                 # The index is coming in externally; we need to validate it
                 for index in rule.indices():
                     self[index] = rule(block, index)
@@ -777,8 +787,26 @@ You can silence this warning by one of three ways:
                 # Slight optimization: if the initializer is known to be
                 # constant, then only call the rule once.
                 val = rule(block, None)
-                for index in self.index_set():
-                    self._setitem_when_not_present(index, val)
+                if not self._setitem_constant_when_not_present(val):
+                    for index in self.index_set():
+                        self._setitem_when_not_present(index, val)
+            elif rule.__class__ is IndexedCallInitializer and normalize_index.flatten:
+                # Slight optimization: the dimensionality of the indices
+                # is fixed by the index set, so we can decide once how
+                # to pass the index to the rule (instead of checking if
+                # each index is a tuple)
+                fcn = rule._fcn
+                index_set = self.index_set()
+                dimen = index_set.dimen
+                if dimen == 1:
+                    for index in index_set:
+                        self._setitem_when_not_present(index, fcn(block, index))
+                elif dimen.__class__ is int and dimen > 1:
+                    for index in index_set:
+                        self._setitem_when_not_present(index, fcn(block, *index))
+                else:
+                    for index in index_set:
+                        self._setitem_when_not_present(index, rule(block, index))
             else:
                 for index in self.index_set():
                     self._setitem_when_not_present(index, rule(block, index))
@@ -1110,6 +1138,16 @@ value() function."""
             raise
         return obj
 
+    def _setitem_constant_when_not_present(self, value):
+        """Store the same value for every index in the index set at once.
+
+        Components whose data can be shared across indices may override
+        this to populate _data in bulk.  Returns False if the values
+        must instead be stored one at a time with
+        :py:meth:`_setitem_when_not_present()`.
+        """
+        return False
+
     def set_value(self, value):
         """Set the value of a scalar component."""
         if self.is_indexed():
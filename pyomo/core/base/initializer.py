@@ -12,6 +12,8 @@
 import collections
 import functools
 import inspect
+import types
+import weakref
 
 from collections.abc import Sequence
 from collections.abc import Mapping
@@ -22,6 +24,8 @@ from pyomo.core.pyomoobject import PyomoObject
 
 initializer_map = {}
 sequence_types = set()
+# (numpy) array types; these are also registered as sequence_types
+array_types = set()
 # initialize with function, method, and method-wrapper types.
 function_types = set(
     [
@@ -30,6 +34,40 @@ function_types = set(
         type(PyomoObject.is_expression_type.__call__),
     ]
 )
+# cache of (argspec, is_generator) for the rules we have already inspected
+_callable_info = weakref.WeakKeyDictionary()
+
+
+def _inspect_callable(fcn):
+    """Return the argspec of ``fcn`` and whether it is a generator function
+
+    Inspecting a rule is relatively expensive, and the same rule is
+    frequently reused to initialize many components, so we cache the
+    results.  Bound methods are created every time the attribute is
+    accessed, so they are cached using the underlying function (note
+    that the argspec for a bound method still includes ``self``).
+    Callables that cannot be weakly referenced are not cached.
+
+    """
+    if inspect.ismethod(fcn):
+        fcn = fcn.__func__
+    try:
+        return _callable_info[fcn]
+    except (KeyError, TypeError):
+        pass
+    # Note: this is equivalent to inspect.isgeneratorfunction() (for
+    # everything except functools.partial objects, where we only need
+    # the argspec), but tests the code flags directly
+    info = (
+        inspect.getfullargspec(fcn),
+        fcn.__class__ is types.FunctionType
+        and bool(fcn.__code__.co_flags & inspect.CO_GENERATOR),
+    )
+    try:
+        _callable_info[fcn] = info
+    except TypeError:
+        pass
+    return info
 
 
 def Initializer(
@@ -72,18 +110,27 @@ def Initializer(
     """
     if arg is arg_not_specified:
         return None
-    if arg.__class__ in initializer_map:
-        return initializer_map[arg.__class__](arg)
-    if arg.__class__ in sequence_types:
+    # Intentional micro-optimization: scalar constants are by far the
+    # most common initializers, and identity tests on the class are
+    # cheaper than the initializer_map lookup
+    _cls = arg.__class__
+    if _cls is int or _cls is float or _cls is str or _cls is bool:
+        return ConstantInitializer(arg)
+    if _cls in initializer_map:
+        return initializer_map[_cls](arg)
+    if _cls in sequence_types:
         if treat_sequences_as_mappings:
+            if _cls in array_types:
+                return ArrayInitializer(arg)
             return ItemInitializer(arg)
         else:
             return ConstantInitializer(arg)
-    if arg.__class__ in function_types:
+    if _cls in function_types:
         # Note: we do not use "inspect.isfunction or inspect.ismethod"
         # because some function-like things (notably cythonized
         # functions) return False
-        if not allow_generators and inspect.isgeneratorfunction(arg):
+        _args, _is_generator = _inspect_callable(arg)
+        if not allow_generators and _is_generator:
             raise ValueError("Generator functions are not allowed")
         # Historically pyomo.core.base.misc.apply_indexed_rule
         # accepted rules that took only the parent block (even for
@@ -95,42 +142,40 @@ def Initializer(
         # the partial handling), but I have been unable to come up with
         # an example.  The closest was getattr(), but that falls back on
         # getattr.__call__, which does support getfullargspec.
-        _args = inspect.getfullargspec(arg)
         _nargs = len(_args.args)
         if inspect.ismethod(arg) and arg.__self__ is not None:
             # Ignore 'self' for bound instance methods and 'cls' for
             # @classmethods
             _nargs -= 1
         if _nargs == 1 and _args.varargs is None:
-            return ScalarCallInitializer(
-                arg, constant=not inspect.isgeneratorfunction(arg)
-            )
+            return ScalarCallInitializer(arg, constant=not _is_generator)
         else:
             return IndexedCallInitializer(arg)
     if hasattr(arg, '__len__'):
         if isinstance(arg, Mapping):
-            initializer_map[arg.__class__] = ItemInitializer
+            initializer_map[_cls] = ItemInitializer
         elif isinstance(arg, Sequence) and not isinstance(arg, str):
-            sequence_types.add(arg.__class__)
+            sequence_types.add(_cls)
         elif isinstance(arg, PyomoObject):
             # TODO: Should IndexedComponent inherit from
             # collections.abc.Mapping?
             if arg.is_component_type() and arg.is_indexed():
-                initializer_map[arg.__class__] = ItemInitializer
+                initializer_map[_cls] = ItemInitializer
             else:
-                initializer_map[arg.__class__] = ConstantInitializer
-        elif any(c.__name__ == 'ndarray' for c in arg.__class__.__mro__):
+                initializer_map[_cls] = ConstantInitializer
+        elif any(c.__name__ == 'ndarray' for c in _cls.__mro__):
             if numpy_available and isinstance(arg, numpy.ndarray):
-                sequence_types.add(arg.__class__)
-        elif any(c.__name__ == 'Series' for c in arg.__class__.__mro__):
+                sequence_types.add(_cls)
+                array_types.add(_cls)
+        elif any(c.__name__ == 'Series' for c in _cls.__mro__):
             if pandas_available and isinstance(arg, pandas.Series):
-                sequence_types.add(arg.__class__)
-        elif any(c.__name__ == 'DataFrame' for c in arg.__class__.__mro__):
+                sequence_types.add(_cls)
+        elif any(c.__name__ == 'DataFrame' for c in _cls.__mro__):
             if pandas_available and isinstance(arg, pandas.DataFrame):
-                initializer_map[arg.__class__] = DataFrameInitializer
+                initializer_map[_cls] = DataFrameInitializer
         else:
             # Note: this picks up (among other things) all string instances
-            initializer_map[arg.__class__] = ConstantInitializer
+            initializer_map[_cls] = ConstantInitializer
         # recursively call Initializer to pick up the new registration
         return Initializer(
             arg,
@@ -149,9 +194,9 @@ def Initializer(
         # segfault in pypy3 7.3.0).  We will immediately expand the
         # generator into a tuple and then store it as a constant.
         return ConstantInitializer(tuple(arg))
-    if type(arg) is functools.partial:
+    if _cls is functools.partial:
         try:
-            _args = inspect.getfullargspec(arg.func)
+            _args = _inspect_callable(arg.func)[0]
         except:
             # Inspect doesn't work for some built-in callables (notably
             # 'int').  We will just have to assume this is a "normal"
@@ -169,7 +214,7 @@ def Initializer(
     if isinstance(arg, PyomoObject):
         # We re-check for PyomoObject here, as that picks up / caches
         # non-components like component data objects and expressions
-        initializer_map[arg.__class__] = ConstantInitializer
+        initializer_map[_cls] = ConstantInitializer
         return ConstantInitializer(arg)
     if callable(arg) and not isinstance(arg, type):
         # We assume any callable thing could be a functor; but, we must
@@ -177,7 +222,7 @@ def Initializer(
         # should not be called (e.g., UnknownSetDimen)
         if inspect.isfunction(arg) or inspect.ismethod(arg):
             # Add this to the set of known function types and try again
-            function_types.add(type(arg))
+            function_types.add(_cls)
         else:
             # Try again, but use the __call__ method (for supporting
             # things like functors and cythonized functions).  __call__
@@ -189,7 +234,7 @@ def Initializer(
             treat_sequences_as_mappings=treat_sequences_as_mappings,
             arg_not_specified=arg_not_specified,
         )
-    initializer_map[arg.__class__] = ConstantInitializer
+    initializer_map[_cls] = ConstantInitializer
     return ConstantInitializer(arg)
 
 
@@ -206,7 +251,11 @@ class InitializerBase(object):
         This class must declare __getstate__ because it is slotized.
         This implementation should be sufficient for simple derived
         classes (where __slots__ are only declared on the most derived
-        class).
+        class).  The most commonly used initializers override this (and
+        __setstate__) to pack their state into a tuple, which is
+        faster and smaller to pickle.  Those overrides still accept the
+        dict state produced by this method, so previously pickled
+        initializers can be loaded.
         """
         return {k: getattr(self, k) for k in self.__slots__}
 
@@ -242,6 +291,14 @@ class ConstantInitializer(InitializerBase):
         self.val = val
         self.verified = False
 
+    def __getstate__(self):
+        return (self.val, self.verified)
+
+    def __setstate__(self, state):
+        if state.__class__ is dict:
+            return InitializerBase.__setstate__(self, state)
+        self.val, self.verified = state
+
     def __call__(self, parent, idx):
         return self.val
 
@@ -257,6 +314,14 @@ class ItemInitializer(InitializerBase):
     def __init__(self, _dict):
         self._dict = _dict
 
+    def __getstate__(self):
+        return (self._dict,)
+
+    def __setstate__(self, state):
+        if state.__class__ is dict:
+            return InitializerBase.__setstate__(self, state)
+        (self._dict,) = state
+
     def __call__(self, parent, idx):
         return self._dict[idx]
 
@@ -270,6 +335,35 @@ class ItemInitializer(InitializerBase):
             return range(len(self._dict))
 
 
+class ArrayInitializer(ItemInitializer):
+    """Initializer for numpy ndarray values
+
+    This supports the same API as :py:class:`ItemInitializer`, but
+    also provides :py:meth:`items` so that components can walk the
+    array once (instead of indexing into it for every index).
+
+    """
+
+    __slots__ = ()
+
+    def indices(self):
+        return range(len(self._dict))
+
+    def items(self):
+        """Return an iterator over the (index, value) pairs in the array"""
+        return zip(range(len(self._dict)), self._dict)
+
+
+# Pre-register the most common container types so that Initializer()
+# resolves them with a single lookup (instead of falling through the
+# isinstance() tests on the first call for each type).  These match the
+# registrations that Initializer() would otherwise make on its own.
+# (The native scalar types are handled before the initializer_map
+# lookup, so they are not registered here.)
+initializer_map[dict] = ItemInitializer
+sequence_types.update((tuple, list))
+
+
 class DataFrameInitializer(InitializerBase):
     """Initializer for pandas DataFrame values"""
 
@@ -305,6 +399,14 @@ class IndexedCallInitializer(InitializerBase):
     def __init__(self, _fcn):
         self._fcn = _fcn
 
+    def __getstate__(self):
+        return (self._fcn,)
+
+    def __setstate__(self, state):
+        if state.__class__ is dict:
+            return InitializerBase.__setstate__(self, state)
+        (self._fcn,) = state
+
     def __call__(self, parent, idx):
         # Note: this is called by a component using data from a Set (so
         # any tuple-like type should have already been checked and
@@ -396,32 +498,48 @@ class CountedCallInitializer(InitializerBase):
         if self._scalar:
             self._is_counted_rule = True
 
+    def __getstate__(self):
+        return (
+            self._fcn,
+            self._is_counted_rule,
+            self._scalar,
+            self._ctype,
+            self._start,
+        )
+
+    def __setstate__(self, state):
+        if state.__class__ is dict:
+            return InitializerBase.__setstate__(self, state)
+        (self._fcn, self._is_counted_rule, self._scalar, self._ctype, self._start) = (
+            state
+        )
+
     def __call__(self, parent, idx):
         # Note: this is called by a component using data from a Set (so
         # any tuple-like type should have already been checked and
         # converted to a tuple; or flattening is turned off and it is
         # the user's responsibility to sort things out.
-        if self._is_counted_rule == False:
+        if self._is_counted_rule is False:
             if idx.__class__ is tuple:
                 return self._fcn(parent, *idx)
             else:
                 return self._fcn(parent, idx)
-        if self._is_counted_rule == True:
+        if self._is_counted_rule is True:
             return CountedCallGenerator(
                 self._ctype, self._fcn, self._scalar, parent, idx, self._start
             )
 
         # Note that this code will only be called once, and only if
-        # the object is not a scalar.
-        _args = inspect.getfullargspec(self._fcn)
+        # the object is not a scalar.  We cannot resolve this when the
+        # initializer is created, as the index passed to the rule need
+        # not match the dimen of the index set (e.g., ConstraintList
+        # always calls the rule with an empty tuple).
+        _args = _inspect_callable(self._fcn)[0]
         _nargs = len(_args.args)
         if inspect.ismethod(self._fcn) and self._fcn.__self__ is not None:
             _nargs -= 1
         _len = len(idx) if idx.__class__ is tuple else 1
-        if _len + 2 == _nargs:
-            self._is_counted_rule = True
-        else:
-            self._is_counted_rule = False
+        self._is_counted_rule = _len + 2 == _nargs
         return self.__call__(parent, idx)
 
 
@@ -434,6 +552,14 @@ class ScalarCallInitializer(InitializerBase):
         self._fcn = _fcn
         self._constant = constant
 
+    def __getstate__(self):
+        return (self._fcn, self._constant)
+
+    def __setstate__(self, state):
+        if state.__class__ is dict:
+            return InitializerBase.__setstate__(self, state)
+        self._fcn, self._constant = state
+
     def __call__(self, parent, idx):
         return self._fcn(parent)
 
@@ -755,6 +755,24 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
             del self._data[index]
             raise
 
+    def _setitem_constant_when_not_present(self, value):
+        # Immutable indexed Params store the raw values in _data, so a
+        # constant (native) value only needs to be validated once
+        # before being stored for every index.  Fall back on setting
+        # the values one at a time if there is an index-dependent
+        # validation rule, or if the value is not valid (so that the
+        # usual error is generated).
+        if (
+            self._mutable
+            or self._validate
+            or not self.is_indexed()
+            or value.__class__ not in native_types
+            or value not in self.domain
+        ):
+            return False
+        self._data.update(dict.fromkeys(self.index_set(), value))
+        return True
+
     def _validate_value(self, index, value, validate_domain=True, data=None):
         """
         Validate a given input/value pair.
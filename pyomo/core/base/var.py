@@ -811,8 +811,16 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
                     for index, obj in self._data.items():
                         obj.lower, obj.upper = self._rule_bounds(block, index)
                 if call_init_rule:
-                    for index, obj in self._data.items():
-                        obj.set_value(self._rule_init(block, index))
+                    if self._rule_init.constant():
+                        # The value is only being re-validated against
+                        # the index-specific domain / bounds: only call
+                        # the rule once.
+                        val = self._rule_init(block, None)
+                        for obj in self._data.values():
+                            obj.set_value(val)
+                    else:
+                        for index, obj in self._data.items():
+                            obj.set_value(self._rule_init(block, index))
             else:
                 # non-dense indexed var with generic
                 # (non-index-containing) initializer: nothing to do
@@ -9,6 +9,7 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import copy
 import functools
 import pickle
 import platform
@@ -29,14 +30,16 @@ from pyomo.core.base.initializer import (
     Initializer,
     ConstantInitializer,
     ItemInitializer,
+    ArrayInitializer,
     ScalarCallInitializer,
     IndexedCallInitializer,
     CountedCallInitializer,
     CountedCallGenerator,
     DataFrameInitializer,
     DefaultInitializer,
+    _inspect_callable,
 )
-from pyomo.environ import ConcreteModel, Var
+from pyomo.environ import ConcreteModel, Param, Var
 
 
 is_pypy = platform.python_implementation().lower().startswith("pypy")
@@ -141,6 +144,32 @@ class Test_Initializer(unittest.TestCase):
         self.assertFalse(a.contains_indices())
         self.assertEqual(a(None, (1, 4)), 8)
 
+    def test_inspect_callable_cache(self):
+        def x_init(m, i):
+            yield i
+
+        info = _inspect_callable(x_init)
+        self.assertEqual(info[0].args, ['m', 'i'])
+        self.assertTrue(info[1])
+        self.assertIs(_inspect_callable(x_init), info)
+
+        class Init(object):
+            def y_init(self, m, i):
+                return i
+
+        obj = Init()
+        info = _inspect_callable(obj.y_init)
+        self.assertEqual(info[0].args, ['self', 'm', 'i'])
+        self.assertFalse(info[1])
+        self.assertIs(_inspect_callable(obj.y_init), info)
+        self.assertIs(_inspect_callable(Init.y_init), info)
+
+        class GenInit(object):
+            def z_init(self, m, i):
+                yield i
+
+        self.assertTrue(_inspect_callable(GenInit().z_init)[1])
+
     def test_counted_call(self):
         def x_init(m, i):
             return i + 1
@@ -678,7 +707,7 @@ class Test_Initializer(unittest.TestCase):
     def test_ndarray(self):
         d = np.array([1, 2, 4])
         a = Initializer(d)
-        self.assertIs(type(a), ItemInitializer)
+        self.assertIs(type(a), ArrayInitializer)
         self.assertFalse(a.constant())
         self.assertFalse(a.verified)
         self.assertTrue(a.contains_indices())
@@ -686,6 +715,15 @@ class Test_Initializer(unittest.TestCase):
         self.assertEqual(a(None, 0), 1)
         self.assertEqual(a(None, 1), 2)
         self.assertEqual(a(None, 2), 4)
+        self.assertEqual(list(a.items()), [(0, 1), (1, 2), (2, 4)])
+
+        a = Initializer(d, treat_sequences_as_mappings=False)
+        self.assertIs(type(a), ConstantInitializer)
+        self.assertIs(a(None, None), d)
+
+        m = ConcreteModel()
+        m.p = Param([0, 1, 2], initialize=d)
+        self.assertEqual(m.p.extract_values(), {0: 1, 1: 2, 2: 4})
 
         # TODO: How should we handle ndarray matrices?
         # d = np.array([[1,2],[4,6]])
@@ -752,6 +790,61 @@ class Test_Initializer(unittest.TestCase):
         self.assertEqual(a(None, 1), 2)
         self.assertEqual(b(None, 2), 3)
 
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        a = CountedCallInitializer(m.x, Initializer(_init_indexed), 5)
+        b = pickle.loads(pickle.dumps(a))
+        self.assertIsNot(a, b)
+        self.assertIs(b._fcn, _init_indexed)
+        self.assertIs(b._ctype, Var)
+        self.assertEqual(b._start, 5)
+        self.assertFalse(b._scalar)
+        self.assertIsNone(b._is_counted_rule)
+
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_pickle_ndarray(self):
+        a = Initializer(np.array([1, 2, 4]))
+        b = pickle.loads(pickle.dumps(a))
+        self.assertIs(type(b), ArrayInitializer)
+        self.assertEqual(list(b.items()), [(0, 1), (1, 2), (2, 4)])
+
+        b = copy.deepcopy(a)
+        self.assertIs(type(b), ArrayInitializer)
+        self.assertEqual(list(b.items()), [(0, 1), (1, 2), (2, 4)])
+
+    def test_setstate_dict(self):
+        # Initializers pickled before the tuple states were introduced
+        # carry a dict of their slots
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        for cls, state in (
+            (ConstantInitializer, {'val': 5, 'verified': True}),
+            (ItemInitializer, {'_dict': {1: 5}}),
+            (ArrayInitializer, {'_dict': [1, 2, 4]}),
+            (IndexedCallInitializer, {'_fcn': _init_indexed}),
+            (ScalarCallInitializer, {'_fcn': _init_scalar, '_constant': False}),
+            (
+                CountedCallInitializer,
+                {
+                    '_fcn': _init_indexed,
+                    '_is_counted_rule': None,
+                    '_scalar': False,
+                    '_ctype': Var,
+                    '_start': 5,
+                },
+            ),
+        ):
+            a = cls.__new__(cls)
+            a.__setstate__(state)
+            for k, v in state.items():
+                self.assertIs(getattr(a, k), v)
+
+        a = Initializer({1: 5})
+        b = ItemInitializer.__new__(ItemInitializer)
+        b.__setstate__({'_dict': a._dict})
+        self.assertEqual(b(None, 1), 5)
+        self.assertEqual(pickle.loads(pickle.dumps(b))._dict, {1: 5})
+
     def test_default_initializer(self):
         a = Initializer({1: 5})
         d = DefaultInitializer(a, None, KeyError)
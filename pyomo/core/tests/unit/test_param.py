@@ -2093,6 +2093,38 @@ class MiscIndexedParamBehaviorTests(unittest.TestCase):
         m.r[1]
         self.assertTrue(1 in m.r)
 
+    def test_rule_index_dimen(self):
+        m = ConcreteModel()
+        m.p = Param([1, 2], initialize=lambda m, i: 10 * i)
+        self.assertEqual(m.p.extract_values(), {1: 10, 2: 20})
+
+        m.q = Param([1, 2], ['a', 'b'], initialize=lambda m, i, j: str(i) + j)
+        self.assertEqual(
+            m.q.extract_values(),
+            {(1, 'a'): '1a', (1, 'b'): '1b', (2, 'a'): '2a', (2, 'b'): '2b'},
+        )
+
+        # jagged (dimen=None) index sets fall back on checking each index
+        m.J = Set(initialize=[1, (2, 3)], dimen=None)
+        m.r = Param(m.J, initialize=lambda m, *idx: len(idx))
+        self.assertEqual(m.r.extract_values(), {1: 1, (2, 3): 2})
+
+    def test_constant_initialize(self):
+        m = ConcreteModel()
+        m.p = Param([1, 2, 3], initialize=5, within=NonNegativeIntegers)
+        self.assertEqual(m.p.extract_values(), {1: 5, 2: 5, 3: 5})
+
+        m.q = Param([1, 2, 3], initialize=5, mutable=True)
+        self.assertEqual(m.q.extract_values(), {1: 5, 2: 5, 3: 5})
+        self.assertIsNot(m.q[1], m.q[2])
+
+        # validation errors still report the offending index
+        with LoggingIntercept():
+            with self.assertRaisesRegex(ValueError, r"r\[2\] = '5'"):
+                m.r = Param([1, 2], initialize=5, validate=lambda m, v, i: i == 1)
+            with self.assertRaisesRegex(ValueError, r"s\[1\] = '-1'"):
+                m.s = Param([1, 2], initialize=-1, within=NonNegativeIntegers)
+
     def test_using_None_in_params(self):
         # These are tests for use cases from github#300
 
@@ -757,6 +757,25 @@ class TestArrayVar(TestSimpleVar):
         self.assertEqual(value(self.instance.x[1].lb), -1.0)
         self.assertEqual(value(self.instance.x[1].ub), 1.0)
 
+    def test_constant_initialize_with_indexed_bounds(self):
+        """Test a constant initialize rule is not called for every index"""
+        calls = []
+
+        def x_init(model):
+            calls.append(None)
+            return 0.5
+
+        def x_bounds(model, i):
+            return (-i, i)
+
+        self.model.x = Var(self.model.A, bounds=x_bounds, initialize=x_init)
+        self.instance = self.model.create_instance()
+        # Once for the template VarData and once for all the indices
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(self.instance.x[1].value, 0.5)
+        self.assertEqual(self.instance.x[2].value, 0.5)
+        self.assertEqual(value(self.instance.x[2].lb), -2)
+
     def test_rule_option(self):
         """Test rule option"""
 
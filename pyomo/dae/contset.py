@@ -11,6 +11,7 @@
 
 import logging
 import bisect
+from pyomo.common.dependencies import numpy, numpy_available
 from pyomo.common.numeric_types import native_numeric_types
 from pyomo.common.timing import ConstructionTimer
 from pyomo.core.base.set import SortedScalarSet
@@ -144,8 +145,7 @@ class ContinuousSet(SortedScalarSet):
         newvalue : `boolean`
 
         """
-        # TODO: Check this if-statement
-        if newvalue is not True and newvalue is not False:
+        if newvalue.__class__ is not bool:
             raise ValueError(
                 "The _changed attribute on a ContinuousSet may "
                 "only be set to True or False"
@@ -164,20 +164,16 @@ class ContinuousSet(SortedScalarSet):
         -------
         float
         """
-        if point in self._fe:
-            return point
-        elif point > max(self._fe):
+        fe = self._fe
+        if point > fe[-1]:
             logger.warning(
                 "The point '%s' exceeds the upper bound "
                 "of the ContinuousSet '%s'. Returning the upper bound"
                 % (str(point), self.name)
             )
-            return max(self._fe)
-        else:
-            for i in self._fe:
-                # This works because the list _fe is always sorted
-                if i > point:
-                    return i
+            return fe[-1]
+        # This works because the list _fe is always sorted
+        return fe[bisect.bisect_left(fe, point)]
 
     def get_lower_element_boundary(self, point):
         """Returns the first finite element point that is less than or
@@ -191,29 +187,24 @@ class ContinuousSet(SortedScalarSet):
         -------
         float
         """
-        if point in self._fe:
-            if 'scheme' in self._discretization_info:
-                if self._discretization_info['scheme'] == 'LAGRANGE-RADAU':
-                    # Because Radau Collocation has a collocation point on the
-                    # upper finite element bound this if statement ensures that
-                    # the desired finite element bound is returned
-                    tmp = self._fe.index(point)
-                    if tmp != 0:
-                        return self._fe[tmp - 1]
-            return point
-        elif point < min(self._fe):
+        fe = self._fe
+        if point < fe[0]:
             logger.warning(
                 "The point '%s' is less than the lower bound "
                 "of the ContinuousSet '%s'. Returning the lower bound "
                 % (str(point), self.name)
             )
-            return min(self._fe)
-        else:
-            rev_fe = list(self._fe)
-            rev_fe.reverse()
-            for i in rev_fe:
-                if i < point:
-                    return i
+            return fe[0]
+        # This works because the list _fe is always sorted
+        i = bisect.bisect_right(fe, point) - 1
+        if fe[i] == point:
+            if i and self._discretization_info.get('scheme') == 'LAGRANGE-RADAU':
+                # Because Radau Collocation has a collocation point on the
+                # upper finite element bound this if statement ensures that
+                # the desired finite element bound is returned
+                return fe[i - 1]
+            return point
+        return fe[i]
 
     def construct(self, values=None):
         """Constructs a :py:class:`ContinuousSet` component"""
@@ -222,10 +213,11 @@ class ContinuousSet(SortedScalarSet):
         timer = ConstructionTimer(self)
         super(ContinuousSet, self).construct(values)
 
-        for val in self:
-            if type(val) is tuple:
-                raise ValueError("ContinuousSet cannot contain tuples")
+        fe = list(self)
+        for val in fe:
             if val.__class__ not in native_numeric_types:
+                if type(val) is tuple:
+                    raise ValueError("ContinuousSet cannot contain tuples")
                 raise ValueError("ContinuousSet can only contain numeric values")
 
         # TBD: If a user specifies bounds they will be added to the set
@@ -254,7 +246,10 @@ class ContinuousSet(SortedScalarSet):
                 " indicating the range over which a differential "
                 "equation is to be discretized" % self.name
             )
-        self._fe = list(self)
+        if len(fe) != len(self):
+            # Bounds were added to the set above
+            fe = list(self)
+        self._fe = fe
         timer.report()
 
     def find_nearest_index(self, target, tolerance=None):
@@ -264,7 +259,9 @@ class ContinuousSet(SortedScalarSet):
         If a tolerance is specified, the index will only be returned
         if the distance between the target and the closest point is
         less than or equal to that tolerance. If there is a tie for
-        closest point, the index on the left is returned.
+        closest point, the index on the left is returned. A warning is
+        logged if more than one point is within the tolerance of the
+        target.
 
         Parameters
         ----------
@@ -273,34 +270,119 @@ class ContinuousSet(SortedScalarSet):
 
         Returns
         -------
-        `float` or `None`
+        `int` or `None`
         """
-        lo = 0
-        hi = len(self)
-        arr = list(self)
-        i = bisect.bisect_right(arr, target, lo=lo, hi=hi)
+        nearest_index, delta, delta_other = self._find_nearest(target)
+        if tolerance is not None:
+            if delta > tolerance:
+                return None
+            if delta_other <= tolerance:
+                logger.warning(
+                    "More than one point in the ContinuousSet '%s' is within "
+                    "the tolerance %s of the target %s. Returning the nearest "
+                    "point." % (self.name, str(tolerance), str(target))
+                )
+        return nearest_index
+
+    def _find_nearest(self, target):
+        """Return the (1-based) index of the point nearest to target, the
+        distance to it and the distance to the second nearest point."""
+        # Search the sorted storage directly rather than copying the set
+        if not self._is_sorted:
+            self._sort()
+        arr = self._ordered_values
+        n = len(arr)
+        i = bisect.bisect_right(arr, target)
         # i is the index at which target should be inserted if it is to be
-        # right of any equal components.
+        # right of any equal components. delta is the distance to the
+        # nearest point and delta_other the distance to the second nearest.
 
-        if i == lo:
+        if i == 0:
             # target is less than every entry of the set
-            nearest_index = i + 1
-            delta = self.at(nearest_index) - target
-        elif i == hi:
+            nearest_index = 1
+            delta = arr[0] - target
+            delta_other = arr[1] - target
+        elif i == n:
             # target is greater than or equal to every entry of the set
-            nearest_index = i
-            delta = target - self.at(nearest_index)
+            nearest_index = n
+            delta = target - arr[-1]
+            delta_other = target - arr[-2]
         else:
             # p_le <= target < p_g
-            # delta_left = target - p_le
-            # delta_right = p_g - target
-            # delta = min(delta_left, delta_right)
             # Tie goes to the index on the left.
-            delta, nearest_index = min(
-                (abs(target - self.at(j)), j) for j in [i, i + 1]
-            )
+            delta_left = target - arr[i - 1]
+            delta_right = arr[i] - target
+            if delta_left <= delta_right:
+                delta, nearest_index = delta_left, i
+                delta_other = delta_right
+            else:
+                delta, nearest_index = delta_right, i + 1
+                delta_other = delta_left
+
+        return nearest_index, delta, delta_other
+
+    def _warn_ambiguous_tolerance(self, targets, tolerance):
+        logger.warning(
+            "More than one point in the ContinuousSet '%s' is within "
+            "the tolerance %s of %s of the targets (the first is %s). "
+            "Returning the nearest point for each."
+            % (self.name, str(tolerance), len(targets), str(targets[0]))
+        )
+
+    def find_nearest_indices(self, targets, tolerance=None):
+        """Returns the indices of the nearest points in the
+        :py:class:`ContinuousSet <pyomo.dae.ContinuousSet>` for each
+        of several targets.
+
+        This is equivalent to calling :py:meth:`find_nearest_index` for
+        every target, but locates all of the targets in a single
+        vectorized search when numpy is available.
 
-        if tolerance is not None:
-            if delta > tolerance:
-                return None
-        return nearest_index
+        Parameters
+        ----------
+        targets : iterable of `float`
+        tolerance : `float` or `None`
+
+        Returns
+        -------
+        `list` of `int` or `None`
+        """
+        if not numpy_available:
+            result = []
+            ambiguous = []
+            for t in targets:
+                nearest_index, delta, delta_other = self._find_nearest(t)
+                if tolerance is not None:
+                    if delta > tolerance:
+                        nearest_index = None
+                    elif delta_other <= tolerance:
+                        ambiguous.append(t)
+                result.append(nearest_index)
+            if ambiguous:
+                self._warn_ambiguous_tolerance(ambiguous, tolerance)
+            return result
+
+        arr = numpy.fromiter(self, dtype=float, count=len(self))
+        targets = numpy.asarray(targets, dtype=float).ravel()
+        n = len(arr)
+        i = numpy.searchsorted(arr, targets, side='right')
+        # The nearest point is always one of arr[lo] and arr[lo + 1] (the
+        # points on either side of the target, or the two end points when
+        # the target is outside the set), and the other is the second
+        # nearest point.
+        lo = numpy.clip(i - 1, 0, n - 2)
+        delta_left = numpy.abs(targets - arr[lo])
+        delta_right = numpy.abs(arr[lo + 1] - targets)
+        # Tie goes to the index on the left.
+        use_right = delta_right < delta_left
+        nearest = lo + use_right + 1
+        if tolerance is None:
+            return nearest.tolist()
+        delta = numpy.minimum(delta_left, delta_right)
+        ambiguous = numpy.maximum(delta_left, delta_right) <= tolerance
+        if ambiguous.any():
+            self._warn_ambiguous_tolerance(targets[ambiguous].tolist(), tolerance)
+        return [
+            idx if ok else None
+            for idx, ok in zip(nearest.tolist(), (delta <= tolerance).tolist())
+        ]
@@ -116,7 +116,8 @@ class Integral(Expression):
         _is_indexed = bool(len(arg))
 
         def _trap_rule(rule, m, *a):
-            ds = sorted(m.find_component(wrt.local_name))
+            # ContinuousSets are always sorted, so no need to re-sort
+            ds = list(m.find_component(wrt.local_name))
             return sum(
                 0.5
                 * (ds[i + 1] - ds[i])
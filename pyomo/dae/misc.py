@@ -42,9 +42,12 @@ def generate_finite_elements(ds, nfe):
         # If only bounds have been specified on the differentialset we
         # generate the desired number of finite elements by
         # spreading them evenly over the interval
-        step = (max(ds) - min(ds)) / float(nfe)
-        tmp = min(ds) + step
-        while round(tmp, 6) <= round((max(ds) - step), 6):
+        lb = ds.first()
+        ub = ds.last()
+        step = (ub - lb) / float(nfe)
+        tmp = lb + step
+        stop = round((ub - step), 6)
+        while round(tmp, 6) <= stop:
             ds.add(round(tmp, 6))
             tmp += step
         ds.set_changed(True)
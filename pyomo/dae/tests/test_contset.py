@@ -22,6 +22,7 @@ from pyomo.environ import ConcreteModel, AbstractModel, Set
 from pyomo.dae import ContinuousSet
 from pyomo.common.log import LoggingIntercept
 from io import StringIO
+from unittest.mock import patch
 
 currdir = dirname(abspath(__file__)) + os.sep
 
@@ -185,6 +186,13 @@ class TestContinuousSet(unittest.TestCase):
             temp = m.t.get_lower_element_boundary(0.5)
         self.assertIn('Returning the lower bound', log_out.getvalue())
 
+        self.assertEqual(m.t.get_lower_element_boundary(1), 1)
+        self.assertEqual(m.t.get_lower_element_boundary(3.5), 3)
+        m.t.get_discretization_info()['scheme'] = 'LAGRANGE-RADAU'
+        self.assertEqual(m.t.get_lower_element_boundary(1), 1)
+        self.assertEqual(m.t.get_lower_element_boundary(2), 1)
+        self.assertEqual(m.t.get_lower_element_boundary(2.5), 2)
+
     def test_duplicate_construct(self):
         m = ConcreteModel()
         m.t = ContinuousSet(initialize=[1, 2, 3])
@@ -273,6 +281,80 @@ class TestContinuousSet(unittest.TestCase):
         # i = m.time.find_nearest_index(2.075)
         # self.assertEqual(i, 7)
 
+    def test_find_nearest_indices(self):
+        m = ConcreteModel()
+        m.time = ContinuousSet(initialize=[0, 0.5, 1, 2.5, 4, 5])
+
+        targets = [-1, 0, 0.2, 0.25, 0.3, 1.75, 2.5, 3.9, 5, 6]
+        for tol in (None, 0, 0.1, 1):
+            self.assertEqual(
+                m.time.find_nearest_indices(targets, tolerance=tol),
+                [m.time.find_nearest_index(t, tolerance=tol) for t in targets],
+            )
+        self.assertEqual(
+            m.time.find_nearest_indices(targets), [1, 1, 1, 1, 2, 3, 4, 5, 6, 6]
+        )
+        self.assertEqual(m.time.find_nearest_indices([]), [])
+
+        # points added out of order are found once the set is re-sorted
+        m.time.add(0.25)
+        m.time.add(0.1)
+        self.assertEqual(m.time.find_nearest_index(0.3), 3)
+        self.assertEqual(m.time.find_nearest_index(0.12, tolerance=0.05), 2)
+
+    def test_find_nearest_index_ambiguous_tolerance(self):
+        m = ConcreteModel()
+        m.time = ContinuousSet(initialize=[0, 0.5, 1])
+
+        log_out = StringIO()
+        with LoggingIntercept(log_out, 'pyomo.dae'):
+            self.assertEqual(m.time.find_nearest_index(0.2, tolerance=0.25), 1)
+            self.assertEqual(m.time.find_nearest_index(1.2, tolerance=0.5), 3)
+            self.assertEqual(m.time.find_nearest_index(-0.2, tolerance=0.5), 1)
+            self.assertEqual(m.time.find_nearest_index(0.2, tolerance=0.1), None)
+        self.assertEqual(log_out.getvalue(), '')
+
+        for target, tol, ans in (
+            (0.2, 0.3, 1),
+            # both end branches compare against the second nearest point
+            (1.2, 1, 3),
+            (-0.2, 0.7, 1),
+        ):
+            log_out = StringIO()
+            with LoggingIntercept(log_out, 'pyomo.dae'):
+                self.assertEqual(m.time.find_nearest_index(target, tol), ans)
+            self.assertIn(
+                "More than one point in the ContinuousSet 'time' is within "
+                "the tolerance %s of the target %s" % (tol, target),
+                log_out.getvalue(),
+            )
+
+        # find_nearest_indices logs one warning per call (with and
+        # without numpy)
+        for use_numpy in (True, False):
+            with patch('pyomo.dae.contset.numpy_available', use_numpy):
+                log_out = StringIO()
+                with LoggingIntercept(log_out, 'pyomo.dae'):
+                    self.assertEqual(
+                        m.time.find_nearest_indices(
+                            [0.2, 0.9, 1.2, -0.2, 1.4, -0.4], tolerance=0.3
+                        ),
+                        [1, 3, 3, 1, None, None],
+                    )
+                self.assertEqual(log_out.getvalue().count("More than one point"), 1)
+
+                log_out = StringIO()
+                with LoggingIntercept(log_out, 'pyomo.dae'):
+                    self.assertEqual(
+                        m.time.find_nearest_indices([1.2, -0.2], tolerance=0.7), [3, 1]
+                    )
+                self.assertEqual(log_out.getvalue().count("More than one point"), 1)
+                self.assertIn(
+                    "within the tolerance 0.7 of 2 of the targets "
+                    "(the first is 1.2)",
+                    log_out.getvalue(),
+                )
+
 
 class TestIO(unittest.TestCase):
     def setUp(self):
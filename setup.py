@@ -86,6 +86,7 @@ if using_cython:
             "pyomo/core/expr/numeric_expr.pyx",
             "pyomo/core/expr/logical_expr.pyx",
             # "pyomo/core/expr/visitor.pyx",
+            "pyomo/core/base/initializer.pyx",
             "pyomo/core/util.pyx",
             "pyomo/repn/standard_repn.pyx",
             "pyomo/repn/plugins/cpxlp.pyx",